@@ -4,44 +4,109 @@ from dotenv import load_dotenv
 from dedalus_labs import AsyncDedalus, DedalusRunner
 import json
 
-load_dotenv()
+try:
+    import aiofiles
+except ImportError:  # pragma: no cover - optional local dependency
+    aiofiles = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional local dependency
+    orjson = None
 
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional local dependency
+    fastjsonschema = None
 
-JSON_FILE_LOCATION = os.getcwd()
+
+
+JSON_FILE_LOCATION = os.path.dirname(os.path.abspath(__file__))
 # Change this when needed
-# JSON_FILE_NAME = 
+# JSON_FILE_NAME =
 JSON_FILE_NAME = "globalInfo.json"
+# Joined once at import so main() does no per-call path assembly.
+CHAT_INFO_JSON_PATH = os.path.join(JSON_FILE_LOCATION, JSON_FILE_NAME)
+
+REQUIRED_CONVO_KEYS = ("conversation", "model", "messages")
+
+# fastjsonschema compiles the schema into a specialized validator function
+# once at import; the tuple loop below is the no-dependency fallback.
+if fastjsonschema is not None:
+    _validateConvo = fastjsonschema.compile(
+        {
+            "type": "object",
+            "required": list(REQUIRED_CONVO_KEYS),
+            "properties": {
+                "conversation": {"type": "object", "required": ["name"]},
+                "model": {"type": "object", "required": ["name"]},
+            },
+        }
+    )
+else:
+    _validateConvo = None
+
+
+def requireKeys(d):
+    if _validateConvo is not None:
+        _validateConvo(d)
+        return
+    missing = [key for key in REQUIRED_CONVO_KEYS if key not in d]
+    if missing:
+        raise KeyError(f"Missing required keys: {missing}")
+
+
+# Shared client so repeat runs reuse the HTTP pool + TLS session.
+_client = None
+_client_lock = asyncio.Lock()
+
+
+async def getClient(api_key):
+    global _client
+    async with _client_lock:
+        if _client is None:
+            _client = await asyncio.to_thread(AsyncDedalus, api_key=api_key)
+        return _client
+
 
-def require(d, key):
-    if key not in d:
-        raise KeyError(f"Missing required key: {key}")
-    return d[key]
+async def readFileBytes(path):
+    # Keep the event loop free while the convo file is read from disk.
+    if aiofiles is not None:
+        async with aiofiles.open(path, "rb") as f:
+            return await f.read()
+
+    def _read():
+        with open(path, "rb") as f:
+            return f.read()
+
+    return await asyncio.to_thread(_read)
 
 
 async def main():
     api_key = os.getenv("DEDALUS_API_KEY")
+    if not api_key:
+        # Only stat/parse .env when the environment isn't already populated.
+        load_dotenv()
+        api_key = os.getenv("DEDALUS_API_KEY")
     if not api_key:
         raise RuntimeError("Missing DEDALUS_API_KEY")
 
-    client = AsyncDedalus(api_key = api_key)
+    # Kick the file read off immediately; it runs while the client and
+    # runner are set up and is only awaited right before its data is needed.
+    file_task = asyncio.create_task(readFileBytes(CHAT_INFO_JSON_PATH))
+
+    client = await getClient(api_key)
+    runner = DedalusRunner(client)
 
-    chatInfoJsonPath = JSON_FILE_LOCATION + "/dedalus_stuff/" + JSON_FILE_NAME
-    with open(chatInfoJsonPath, "r", encoding="utf-8") as convoInfo:
-        convoData = json.load(convoInfo)
+    raw = await file_task
+    convoData = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-    require(convoData, "conversation")
-    require(convoData, "model")
-    require(convoData, "messages")
+    requireKeys(convoData)
 
 
     convoName = convoData["conversation"]["name"]
     runningModel = convoData["model"]["name"]
 
-
-
-    runner = DedalusRunner(client)
-
     response = await runner.run(
         input="Hello, what can you do?",
         model="anthropic/claude-opus-4-5",
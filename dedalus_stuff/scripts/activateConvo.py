@@ -1,19 +1,97 @@
+import copy
+import os
 from pathlib import Path
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional local dependency
+    orjson = None
+
+# Resolved once at import so setActiveConvo does no per-call Path churn.
+_PARENT_DIR = Path(__file__).resolve().parent.parent
+_GLOBAL_INFO_PATH = str(_PARENT_DIR / "globalInfo.json")
+_CONVOS_DIR = str(_PARENT_DIR / "conversations")
+
+# path -> (mtime_ns, size, parsed dict); lets repeated convo toggles skip
+# the disk read + JSON parse when globalInfo.json has not changed.
+_JSON_CACHE = {}
+
+# 64 KiB covers the whole document, so reads and writes hit disk in one go.
+_IO_BUFFER_SIZE = 65536
+
+
+def writeFileBytes(path, data):
+  # Single os-level write to a temp file, then an atomic rename so a crash
+  # mid-write can never leave a truncated globalInfo.json behind.
+  path = str(path)
+  tmp_path = path + ".tmp"
+  fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+  try:
+    os.write(fd, data)
+    os.fsync(fd)
+  finally:
+    os.close(fd)
+  try:
+    os.replace(tmp_path, path)
+  except Exception:
+    try:
+      os.unlink(tmp_path)
+    except OSError:
+      pass
+    raise
+
+
+def invalidate(path):
+  _JSON_CACHE.pop(str(path), None)
+
+
+def loadJsonBytes(raw):
+  if orjson is not None:
+    return orjson.loads(raw)
+  return json.loads(raw)
+
+
+def dumpJsonBytes(data):
+  if orjson is not None:
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+  return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def loadGlobalInfo(global_file_path):
+  cache_key = str(global_file_path)
+  stat = os.stat(global_file_path)
+  cached = _JSON_CACHE.get(cache_key)
+  if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+    # Deep copy so callers can mutate without dirtying the cached copy.
+    return copy.deepcopy(cached[2])
+
+  with open(global_file_path, "rb", buffering=_IO_BUFFER_SIZE) as f:
+    global_data = loadJsonBytes(f.read())
+  _JSON_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(global_data))
+  return global_data
+
+
 def setActiveConvo(convoNum):
-  parentDir = Path(__file__).resolve().parent.parent
-  global_file_path = parentDir / "globalInfo.json"
-  with open(global_file_path, "r", encoding="utf-8") as f:
-    global_data = json.load(f)
-
-  activeFileName = "conversation" + str(convoNum) + ".json"
-  activePath = parentDir / "conversations" / activeFileName
-  global_data["activeFileDetails"]["activeChatIndex"] = int(convoNum)
-  global_data["activeFileDetails"]["activeJsonFilePath"] = str(activePath)
-  global_data["activeFileDetails"]["existsActive"] = True
-
-  with open(global_file_path, "w", encoding="utf-8", newline="\n") as f:
-      json.dump(global_data, f, ensure_ascii=False, indent=2)
+  global_data = loadGlobalInfo(_GLOBAL_INFO_PATH)
+
+  convoNum = int(convoNum)
+  activePath = os.path.join(_CONVOS_DIR, f"conversation{convoNum}.json")
+  details = global_data["activeFileDetails"]
+  if (
+      details.get("activeChatIndex") == convoNum
+      and details.get("activeJsonFilePath") == activePath
+      and details.get("existsActive") is True
+  ):
+    # Already the active convo: skip the re-serialize + rewrite entirely.
+    return details
+  details["activeChatIndex"] = convoNum
+  details["activeJsonFilePath"] = activePath
+  details["existsActive"] = True
+
+  writeFileBytes(_GLOBAL_INFO_PATH, dumpJsonBytes(global_data))
+
+  stat = os.stat(_GLOBAL_INFO_PATH)
+  _JSON_CACHE[_GLOBAL_INFO_PATH] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(global_data))
 
   return global_data["activeFileDetails"]
@@ -1,13 +1,18 @@
 import argparse
 import asyncio
+import functools
+import importlib.util
+import io
 import json
 import math
 import os
 import re
 import sys
-import urllib.error
-import urllib.request
+import time
+import http.client
 from datetime import datetime, timezone
+from itertools import chain, islice
+from urllib.parse import urlsplit
 from pathlib import Path
 from uuid import uuid4
 
@@ -17,13 +22,46 @@ except ImportError:  # pragma: no cover - optional local dependency
     def load_dotenv() -> None:
         return None
 
+# The SDK import is deferred to run_dedalus_with_sdk so the HTTP streaming
+# path (the default) never pays its import cost; find_spec only checks that
+# the package is installed without executing it.
+HAS_DEDALUS_SDK = importlib.util.find_spec("dedalus_labs") is not None
+
 try:
-    from dedalus_labs import AsyncDedalus, DedalusRunner
-    HAS_DEDALUS_SDK = True
+    import orjson
 except ImportError:  # pragma: no cover - optional local dependency
-    AsyncDedalus = None
-    DedalusRunner = None
-    HAS_DEDALUS_SDK = False
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional local dependency
+    uvloop = None
+
+
+# Resolve env_costs once at import instead of mutating sys.path and walking
+# the import machinery on every API response.
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+try:
+    import env_costs as _env_costs
+    _GET_COST = getattr(_env_costs, "get_cost", None)
+except Exception:  # pragma: no cover - optional local module
+    _GET_COST = None
+if not callable(_GET_COST):
+    _GET_COST = None
+
+
+def json_dumps_bytes(obj: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: bytes | str) -> object:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 DEFAULT_SYSTEM_PROMPT = (
@@ -44,11 +82,32 @@ DEFAULT_USER_AGENT = (
 )
 DEFAULT_HISTORY_WINDOW_MESSAGES = 14
 DEFAULT_HISTORY_SUMMARY_MAX_CHARS = 1800
+# Token events are coalesced up to this count / window before one emit.
+_TOKEN_BATCH_SIZE = 8
+_TOKEN_BATCH_WINDOW_SECONDS = 0.004
+# Coarse per-message cap applied while reading stored history, ~4x the largest
+# per-message compression budget, so downstream compaction never sees bytes it
+# would discard anyway.
+_COARSE_MESSAGE_CAP = 8800
+
+# Compiled once at import; these run per line/message in the history hot paths.
+_WS_RE = re.compile(r"\s+")
+_CRLF_RE = re.compile(r"\r\n?")
+_VALID_ROLES = frozenset(("user", "assistant", "system"))
+
+# Signal-line dispatch: cheap C-level str scans first, with a small compiled
+# pattern only for the structural cases (numbered lists, inline/fenced code).
+_SIGNAL_CHARS = frozenset("{}[]();=<>")
+_SIGNAL_KEYWORDS = ("error", "exception", "traceback", "failed", "must", "required", "todo", "fix", "bug")
+_SIGNAL_EDGE_RE = re.compile(r"^\s*\d+[.)]\s+|```|`[^`]+`")
 
 
 def emit(event_type: str, **payload: object) -> None:
     event = {"type": event_type, **payload}
-    print(json.dumps(event, ensure_ascii=False), flush=True)
+    buffer = sys.stdout.buffer
+    buffer.write(json_dumps_bytes(event))
+    buffer.write(b"\n")
+    buffer.flush()
 
 
 def now_iso() -> str:
@@ -59,8 +118,8 @@ def load_json_or_empty(path: Path) -> dict:
     if not path.exists():
         return {}
 
-    with path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    with path.open("rb") as handle:
+        raw = json_loads(handle.read())
 
     if isinstance(raw, dict):
         return raw
@@ -128,10 +187,23 @@ def normalize_global_info_payload(payload: dict) -> dict:
     }
 
 
+def _conversation_index(value: str) -> int | None:
+    """Parse the trailing number out of a canonical "conversation<N>" id.
+
+    Plain slicing; cheaper than a regex for a fixed prefix. isdecimal (not
+    isdigit) so only strings int() accepts take the fast path.
+    """
+    if value[:12].lower() == "conversation":
+        tail = value[12:]
+        if tail.isdecimal():
+            return int(tail)
+    return None
+
+
 def default_conversation_title(conversation_id: str) -> str:
-    match = re.match(r"^conversation(\d+)$", conversation_id, flags=re.IGNORECASE)
-    if match:
-        return f"Conversation {int(match.group(1))}"
+    index = _conversation_index(conversation_id)
+    if index is not None:
+        return f"Conversation {index}"
     return conversation_id
 
 
@@ -140,9 +212,9 @@ def normalize_conversation_title(raw_name: str, conversation_id: str) -> str:
     if not trimmed:
         return default_conversation_title(conversation_id)
 
-    match = re.match(r"^conversation(\d+)$", trimmed, flags=re.IGNORECASE)
-    if match:
-        return f"Conversation {int(match.group(1))}"
+    index = _conversation_index(trimmed)
+    if index is not None:
+        return f"Conversation {index}"
 
     return trimmed
 
@@ -150,12 +222,22 @@ def normalize_conversation_title(raw_name: str, conversation_id: str) -> str:
 def save_json(path: Path, payload: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     temp_path = path.with_name(f".{path.name}.{os.getpid()}.{uuid4().hex}.tmp")
-    with temp_path.open("w", encoding="utf-8", newline="\n") as handle:
-        json.dump(payload, handle, ensure_ascii=False, indent=2)
-        handle.write("\n")
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
 
+    # Single os-level write + fsync so the atomic rename below always lands a
+    # fully durable document.
+    fd = os.open(str(temp_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
     try:
-        temp_path.replace(path)
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    try:
+        os.replace(temp_path, path)
     except Exception:
         try:
             temp_path.unlink(missing_ok=True)
@@ -164,6 +246,39 @@ def save_json(path: Path, payload: dict) -> None:
         raise
 
 
+def conversation_transcript_path(conversation_json_path: Path) -> Path:
+    return conversation_json_path.with_suffix(".jsonl")
+
+
+def load_transcript_messages(transcript_path: Path) -> list[dict]:
+    """Stream message entries from an append-only JSONL transcript."""
+    if not transcript_path.exists():
+        return []
+
+    messages: list[dict] = []
+    with transcript_path.open("rb") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json_loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict):
+                messages.append(entry)
+    return messages
+
+
+def append_transcript_turn(transcript_path: Path, user_message: str, assistant_text: str) -> None:
+    """O(1) per-turn persistence: append both sides of the turn as JSONL."""
+    transcript_path.parent.mkdir(parents=True, exist_ok=True)
+    timestamp = now_iso()
+    with transcript_path.open("ab") as handle:
+        handle.write(json_dumps_bytes({"role": "user", "text": user_message, "ts": timestamp}) + b"\n")
+        handle.write(json_dumps_bytes({"role": "assistant", "text": assistant_text, "ts": timestamp}) + b"\n")
+
+
 def ensure_conversation_bundle(path: Path, conversation_id: str) -> dict:
     raw = load_json_or_empty(path)
 
@@ -183,6 +298,11 @@ def ensure_conversation_bundle(path: Path, conversation_id: str) -> dict:
     if not isinstance(stored_messages, list):
         stored_messages = []
 
+    if not stored_messages:
+        # CLI-only conversations persist turns in the append-only sidecar
+        # transcript; snapshot writers that fill the .json bundle still win.
+        stored_messages = load_transcript_messages(conversation_transcript_path(path))
+
     bundle = {
         "conversation": {
             "id": conversation.get("id", conversation_id),
@@ -216,7 +336,7 @@ def get_system_prompt(bundle: dict) -> str:
 def _compact_text(value: str, max_chars: int) -> str:
     if max_chars <= 0:
         return ""
-    compact = re.sub(r"\s+", " ", value).strip()
+    compact = _WS_RE.sub(" ", value).strip()
     if len(compact) <= max_chars:
         return compact
     if max_chars <= 2:
@@ -228,25 +348,34 @@ def _clamp_int(value: int, minimum: int, maximum: int) -> int:
     return max(minimum, min(maximum, int(value)))
 
 
+# Pressure coefficients fold the constant denominators (window span, summary
+# span above its 400-char floor) and the 0.6/0.4 blend into two multipliers.
+_WINDOW_PRESSURE_COEF = 0.6 / max(DEFAULT_HISTORY_WINDOW_MESSAGES - 1, 1)
+_SUMMARY_PRESSURE_COEF = 0.4 / max(DEFAULT_HISTORY_SUMMARY_MAX_CHARS - 400, 1)
+
+
 def _history_compression_pressure(history_window: int, summary_limit: int) -> float:
-    window_denom = max(DEFAULT_HISTORY_WINDOW_MESSAGES - 1, 1)
-    summary_floor = 400
-    summary_denom = max(DEFAULT_HISTORY_SUMMARY_MAX_CHARS - summary_floor, 1)
-    window_pressure = max(DEFAULT_HISTORY_WINDOW_MESSAGES - history_window, 0) / window_denom
-    summary_pressure = max(DEFAULT_HISTORY_SUMMARY_MAX_CHARS - summary_limit, 0) / summary_denom
-    return min(max((window_pressure * 0.6) + (summary_pressure * 0.4), 0.0), 1.0)
+    pressure = (
+        max(DEFAULT_HISTORY_WINDOW_MESSAGES - history_window, 0) * _WINDOW_PRESSURE_COEF
+        + max(DEFAULT_HISTORY_SUMMARY_MAX_CHARS - summary_limit, 0) * _SUMMARY_PRESSURE_COEF
+    )
+    # Both terms are non-negative, so only the upper clamp is needed.
+    return pressure if pressure < 1.0 else 1.0
 
 
 def _is_signal_line(line: str) -> bool:
     if not line:
         return False
-    return bool(
-        re.search(
-            r"(```|`[^`]+`|^\s*[-*]\s+|^\s*\d+[.)]\s+|error|exception|traceback|failed|must|required|todo|fix|bug|[{}\[\]();=<>])",
-            line,
-            flags=re.IGNORECASE,
-        )
-    )
+    if not _SIGNAL_CHARS.isdisjoint(line):
+        return True
+    stripped = line.lstrip()
+    if stripped and stripped[0] in "-*" and stripped[1:2].isspace():
+        return True
+    lowered = line.lower()
+    for keyword in _SIGNAL_KEYWORDS:
+        if keyword in lowered:
+            return True
+    return bool(_SIGNAL_EDGE_RE.search(line))
 
 
 def _compact_with_head_tail(value: str, max_chars: int) -> str:
@@ -257,54 +386,76 @@ def _compact_with_head_tail(value: str, max_chars: int) -> str:
     if max_chars <= 7:
         return value[:max_chars].rstrip()
 
-    head_budget = max(1, int(max_chars * 0.62))
-    tail_budget = max(1, max_chars - head_budget - 5)
-    compacted = f"{value[:head_budget].rstrip()}\n...\n{value[-tail_budget:].lstrip()}"
-    if len(compacted) <= max_chars:
-        return compacted
-    return _compact_text(compacted, max_chars)
+    # Budgets are sized against max_chars minus the 5-char separator, and the
+    # strips can only shrink the pieces, so the result is guaranteed to fit
+    # and the old re-compact fallback pass is unnecessary.
+    usable = max_chars - 5
+    head_budget = max(1, int(usable * 0.62))
+    tail_budget = max(1, usable - head_budget)
+    return f"{value[:head_budget].rstrip()}\n...\n{value[-tail_budget:].lstrip()}"
 
 
+# History grows monotonically, so the same (text, budget) pairs recur every
+# turn; 512 entries matches the stdlib regex cache sizing.
+@functools.lru_cache(maxsize=512)
 def _compact_message_text(value: str, max_chars: int) -> str:
     if max_chars <= 0:
         return ""
 
-    normalized_lines = [line.strip() for line in value.replace("\r\n", "\n").replace("\r", "\n").split("\n")]
-    normalized_lines = [line for line in normalized_lines if line]
+    # Single pass: strip, drop blanks, and track the joined length as we go so
+    # the short-message case never builds a second list or a throwaway join.
+    normalized_lines: list[str] = []
+    total_len = 0
+    for raw_line in _CRLF_RE.sub("\n", value).split("\n"):
+        line = raw_line.strip()
+        if not line:
+            continue
+        normalized_lines.append(line)
+        total_len += len(line) + 1
     if not normalized_lines:
         return ""
 
-    normalized = "\n".join(normalized_lines)
-    if len(normalized) <= max_chars:
-        return normalized
+    if total_len - 1 <= max_chars:
+        return "\n".join(normalized_lines)
 
+    last_index = len(normalized_lines) - 1
     selected_lines: list[str] = []
-    seen: set[str] = set()
+    seen_hashes: set[int] = set()
     for index, line in enumerate(normalized_lines):
-        is_edge_line = index == 0 or index == len(normalized_lines) - 1
+        is_edge_line = index == 0 or index == last_index
         if not (is_edge_line or _is_signal_line(line)):
             continue
-        if line in seen:
+        line_hash = hash(line)
+        if line_hash in seen_hashes:
             continue
-        seen.add(line)
+        seen_hashes.add(line_hash)
         selected_lines.append(line)
 
     candidate = "\n".join(selected_lines).strip()
     if candidate:
         return _compact_with_head_tail(candidate, max_chars)
-    return _compact_with_head_tail(normalized, max_chars)
+    return _compact_with_head_tail("\n".join(normalized_lines), max_chars)
 
 
-def _select_messages_for_summary(messages: list[dict], max_entries: int) -> list[dict]:
-    if len(messages) <= max_entries:
-        return messages
+def _select_messages_for_summary(messages: list[dict], max_entries: int) -> tuple[object, int]:
+    """Return (iterable of selected entries, selected count) without slicing.
+
+    The chained islice view is consumed exactly once by the summary builder,
+    so no intermediate head/tail lists are allocated.
+    """
+    total = len(messages)
+    if total <= max_entries:
+        return messages, total
 
     safe_max_entries = max(1, max_entries)
     head_count = min(2, max(1, safe_max_entries // 3))
     tail_count = max(0, safe_max_entries - head_count)
     if tail_count == 0:
-        return messages[-safe_max_entries:]
-    return messages[:head_count] + messages[-tail_count:]
+        return islice(messages, total - safe_max_entries, None), safe_max_entries
+    return (
+        chain(islice(messages, head_count), islice(messages, total - tail_count, None)),
+        head_count + tail_count,
+    )
 
 
 def _build_history_summary(messages: list[dict], max_chars: int) -> str:
@@ -313,9 +464,9 @@ def _build_history_summary(messages: list[dict], max_chars: int) -> str:
 
     summary_limit = max(140, int(max_chars))
     max_summary_entries = _clamp_int(summary_limit // 120, 4, 36)
-    selected_messages = _select_messages_for_summary(messages, max_summary_entries)
-    omitted_count = max(0, len(messages) - len(selected_messages))
-    per_message_cap = _clamp_int(summary_limit // max(len(selected_messages) + 1, 5), 90, 260)
+    selected_messages, selected_count = _select_messages_for_summary(messages, max_summary_entries)
+    omitted_count = max(0, len(messages) - selected_count)
+    per_message_cap = _clamp_int(summary_limit // max(selected_count + 1, 5), 90, 260)
 
     lines: list[str] = []
     remaining = summary_limit
@@ -329,7 +480,7 @@ def _build_history_summary(messages: list[dict], max_chars: int) -> str:
     for entry in selected_messages:
         role = entry.get("role")
         content = entry.get("content")
-        if role not in {"user", "assistant", "system"} or not isinstance(content, str):
+        if role not in _VALID_ROLES or not isinstance(content, str):
             continue
         normalized = _compact_message_text(content, per_message_cap)
         if not normalized:
@@ -384,7 +535,7 @@ def _compress_recent_messages(
         tail_role = tail.get("role")
         tail_content = tail.get("content")
         if (
-            tail_role in {"user", "assistant", "system"}
+            tail_role in _VALID_ROLES
             and isinstance(tail_content, str)
             and tail_content.strip()
         ):
@@ -406,30 +557,35 @@ def _compress_recent_messages(
     )
     available_pool_budget = max(effective_total_budget - preserved_tail_len, minimum_pool_budget)
 
-    weights: list[float] = []
+    # Hoisted inverses turn the per-message math into tight multiplies; the
+    # budget pass reuses one precomputed scale instead of dividing per entry.
+    inv_denom = 1.0 / max(pool_count - 1, 1)
+    recency_bump = 0.9 * inv_denom
+    # Preallocated and filled by index: no append bookkeeping or list growth.
+    weights = [0.0] * pool_count
     for index, entry in enumerate(message_pool):
-        recency = index / max(pool_count - 1, 1)
         role = entry.get("role")
-        weight = 1.0 + (0.9 * recency)
+        weight = 1.0 + (recency_bump * index)
         if role == "user":
             weight += 0.25
         elif role == "system":
             weight += 0.1
         if index >= pool_count - 2:
             weight += 0.2
-        weights.append(weight)
+        weights[index] = weight
 
     weight_sum = sum(weights) or float(pool_count)
-    char_budgets: list[int] = []
-    for weight in weights:
-        share = available_pool_budget * (weight / weight_sum)
-        char_budgets.append(_clamp_int(int(round(share)), min_chars_per_message, max_chars_per_message))
+    budget_scale = available_pool_budget / weight_sum
+    char_budgets = [
+        _clamp_int(int(weight * budget_scale + 0.5), min_chars_per_message, max_chars_per_message)
+        for weight in weights
+    ]
 
     compressed_messages: list[dict] = []
     for entry, message_budget in zip(message_pool, char_budgets):
         role = entry.get("role")
         content = entry.get("content")
-        if role not in {"user", "assistant", "system"} or not isinstance(content, str):
+        if role not in _VALID_ROLES or not isinstance(content, str):
             continue
         compacted = _compact_message_text(content, message_budget)
         if compacted:
@@ -476,9 +632,20 @@ def normalize_messages_for_api(
             continue
         role = entry.get("role")
         text = entry.get("text")
-        if role in {"user", "assistant", "system"} and isinstance(text, str) and text.strip():
+        if role in _VALID_ROLES and isinstance(text, str) and text.strip():
             normalized_messages.append({"role": role, "content": text})
 
+    # Coarse cap only the entries feeding the summary/compression pool. The
+    # final stored message stays verbatim: it is the just-sent user message,
+    # and capping it here would break ensure_latest_user_message's equality
+    # dedup (double-sending the text) plus the preserved-tail guarantee of
+    # _compress_recent_messages.
+    half = _COARSE_MESSAGE_CAP // 2
+    for entry in normalized_messages[:-1]:
+        text = entry["content"]
+        if len(text) > _COARSE_MESSAGE_CAP:
+            entry["content"] = f"{text[:half]}\n...\n{text[-half:]}"
+
     history_window = max(1, int(history_window_messages))
     summary_limit = max(240, int(history_summary_max_chars))
     compression_pressure = _history_compression_pressure(history_window, summary_limit)
@@ -513,6 +680,16 @@ def normalize_messages_for_api(
         max(180, len(normalized_messages) * 170),
         max(2200, len(normalized_messages) * 2200),
     )
+
+    # Fast path for the common short conversation: when everything already
+    # fits the budget and no message exceeds the per-message ceiling, the
+    # compression pipeline would be a no-op, so skip its weight/budget math.
+    total_chars = sum(len(entry["content"]) for entry in normalized_messages)
+    longest = max((len(entry["content"]) for entry in normalized_messages), default=0)
+    if total_chars <= bounded_recent_budget and longest <= 2200:
+        api_messages.extend(normalized_messages)
+        return api_messages
+
     api_messages.extend(
         _compress_recent_messages(
             normalized_messages,
@@ -567,23 +744,22 @@ def extract_error_message_from_json(raw_body: str, default: str) -> str:
 
 
 def extract_text_fragments(value: object) -> list[str]:
-    if isinstance(value, str):
-        return [value] if value else []
-
-    if isinstance(value, list):
-        fragments: list[str] = []
-        for item in value:
-            fragments.extend(extract_text_fragments(item))
-        return fragments
-
-    if isinstance(value, dict):
-        fragments: list[str] = []
-        for key in ("text", "content", "value", "output_text"):
-            if key in value:
-                fragments.extend(extract_text_fragments(value.get(key)))
-        return fragments
-
-    return []
+    # Explicit-stack DFS; children are pushed reversed so pops preserve the
+    # original recursive order without per-node function-call overhead.
+    fragments: list[str] = []
+    stack: list[object] = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, str):
+            if current:
+                fragments.append(current)
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+        elif isinstance(current, dict):
+            for key in ("output_text", "value", "content", "text"):
+                if key in current:
+                    stack.append(current[key])
+    return fragments
 
 
 def extract_stream_tokens_from_choice(choice: dict) -> list[str]:
@@ -676,22 +852,11 @@ def calculate_carbon_from_env_costs(
     if prompt_tokens < 0 or completion_tokens < 0:
         return None
 
-    repo_root = Path(__file__).resolve().parents[2]
-    repo_root_str = str(repo_root)
-    if repo_root_str not in sys.path:
-        sys.path.insert(0, repo_root_str)
-
-    try:
-        import env_costs  # type: ignore
-    except Exception:
-        return None
-
-    get_cost = getattr(env_costs, "get_cost", None)
-    if not callable(get_cost):
+    if _GET_COST is None:
         return None
 
     try:
-        value = get_cost(model_name, prompt_tokens, completion_tokens)
+        value = _GET_COST(model_name, prompt_tokens, completion_tokens)
     except Exception:
         return None
 
@@ -700,6 +865,62 @@ def calculate_carbon_from_env_costs(
     return None
 
 
+# Keep-alive connections by origin, reused across turns in the same process
+# so repeat requests skip the TCP + TLS handshake. urllib.request opens a
+# fresh connection per call; http.client gives us pooling with no new deps.
+_HTTP_POOL: dict[str, http.client.HTTPConnection] = {}
+
+
+def _discard_pooled_connection(url: str) -> None:
+    # Drop the connection for this origin instead of pooling it: after an
+    # early exit mid-body the socket may hold unread bytes, and reusing it
+    # would desync the next request (and retry-POST an already-delivered one).
+    parts = urlsplit(url)
+    connection = _HTTP_POOL.pop(f"{parts.scheme}://{parts.netloc}", None)
+    if connection is not None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+def _post_with_keepalive(
+    url: str,
+    body: bytes,
+    headers: dict[str, str],
+    timeout: float = 300,
+) -> http.client.HTTPResponse:
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+
+    last_error: Exception | None = None
+    for attempt in range(2):
+        connection = _HTTP_POOL.get(origin)
+        if connection is None:
+            if parts.scheme == "http":
+                connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=timeout)
+            else:
+                connection = http.client.HTTPSConnection(parts.hostname, parts.port or 443, timeout=timeout)
+            _HTTP_POOL[origin] = connection
+
+        try:
+            connection.request("POST", path, body=body, headers=headers)
+            return connection.getresponse()
+        except (http.client.HTTPException, OSError) as error:
+            # Stale keep-alive socket (server closed it between turns): drop
+            # the pooled connection and retry once on a fresh one.
+            last_error = error
+            _HTTP_POOL.pop(origin, None)
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    assert last_error is not None
+    raise last_error
+
+
 def run_dedalus_stream(
     *,
     api_key: str,
@@ -721,23 +942,32 @@ def run_dedalus_stream(
     if isinstance(available_models, list) and available_models:
         payload["available_models"] = available_models
 
-    request = urllib.request.Request(
-        url=f"{api_base_url.rstrip('/')}/chat/completions",
-        data=json.dumps(payload).encode("utf-8"),
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-            "Accept": "text/event-stream" if stream else "application/json",
-            "User-Agent": user_agent,
-        },
-        method="POST",
-    )
+    url = f"{api_base_url.rstrip('/')}/chat/completions"
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "Accept": "text/event-stream" if stream else "application/json",
+        "User-Agent": user_agent,
+    }
+
+    try:
+        response = _post_with_keepalive(url, json_dumps_bytes(payload), headers)
+    except (http.client.HTTPException, OSError) as error:
+        raise RuntimeError(f"Failed to reach Dedalus API: {error}") from error
 
     try:
-        with urllib.request.urlopen(request, timeout=300) as response:
+        with response:
+            if response.status >= 400:
+                body = response.read().decode("utf-8", errors="replace")
+                default_message = f"Dedalus request failed with status {response.status}."
+                message = extract_error_message_from_json(body, default_message)
+                if message == default_message and body.strip():
+                    message = f"{default_message} {body[:500]}"
+                raise RuntimeError(message)
+
             if not stream:
                 body = response.read().decode("utf-8", errors="replace")
-                parsed = json.loads(body)
+                parsed = json_loads(body)
                 choices = parsed.get("choices", []) if isinstance(parsed, dict) else []
                 if not choices or not isinstance(choices[0], dict):
                     raise RuntimeError("Dedalus returned no completion choices.")
@@ -754,20 +984,43 @@ def run_dedalus_stream(
                 usage = normalize_usage_payload(parsed.get("usage")) if isinstance(parsed, dict) else None
                 return content, normalized_reason, usage
 
-            full_text_parts: list[str] = []
+            # StringIO accumulates token text without holding thousands of
+            # small str objects alive for a final join.
+            full_text = io.StringIO()
             finish_reason = "stop"
             usage_counts: dict[str, int] | None = None
-            
-            def consume_chunk_payload(payload: str) -> bool:
+
+            # Coalesce bursts of tokens into one emitted event (still type
+            # "token", with the fragments joined) so fast models pay one
+            # json-encode + write + flush per batch instead of per token.
+            token_buffer: list[str] = []
+            last_token_flush = time.monotonic()
+
+            def flush_tokens() -> None:
+                nonlocal last_token_flush
+                if token_buffer:
+                    emit("token", token="".join(token_buffer))
+                    token_buffer.clear()
+                last_token_flush = time.monotonic()
+
+            def queue_token(token: str) -> None:
+                full_text.write(token)
+                token_buffer.append(token)
+                if len(token_buffer) >= _TOKEN_BATCH_SIZE or time.monotonic() - last_token_flush > _TOKEN_BATCH_WINDOW_SECONDS:
+                    flush_tokens()
+
+
+            def consume_chunk_payload(payload: bytes) -> bool:
                 nonlocal finish_reason, usage_counts
 
-                if payload == "[DONE]":
+                if payload == b"[DONE]":
                     return True
 
                 try:
-                    chunk = json.loads(payload)
-                except json.JSONDecodeError:
-                    # Ignore malformed non-JSON chunks.
+                    chunk = json_loads(payload)
+                except ValueError:
+                    # Ignore malformed non-JSON chunks (covers both stdlib and
+                    # orjson decode errors).
                     return False
 
                 if not isinstance(chunk, dict):
@@ -789,8 +1042,7 @@ def run_dedalus_stream(
                             continue
 
                         for token in extract_stream_tokens_from_choice(choice):
-                            full_text_parts.append(token)
-                            emit("token", token=token)
+                            queue_token(token)
 
                         if usage_counts is None:
                             usage_counts = normalize_usage_payload(choice.get("usage"))
@@ -801,36 +1053,37 @@ def run_dedalus_stream(
                     return False
 
                 for token in extract_text_fragments(chunk):
-                    full_text_parts.append(token)
-                    emit("token", token=token)
+                    queue_token(token)
 
                 return False
 
-            def consume_event_lines(event_lines: list[str]) -> bool:
+            def consume_event_lines(event_lines: list[bytes]) -> bool:
                 if not event_lines:
                     return False
 
-                data_lines: list[str] = []
+                data_lines: list[bytes] = []
                 for line in event_lines:
-                    if line.startswith("data:"):
-                        data_lines.append(line[len("data:") :].lstrip())
+                    if line.startswith(b"data:"):
+                        data_lines.append(line[len(b"data:") :].lstrip())
 
                 if data_lines:
-                    payload = "\n".join(data_lines).strip()
+                    payload = b"\n".join(data_lines).strip()
                     if payload:
                         return consume_chunk_payload(payload)
                     return False
 
                 # Fallback when providers proxy non-SSE JSON despite stream=true.
-                payload = "\n".join(event_lines).strip()
-                if payload.startswith("{"):
+                payload = b"\n".join(event_lines).strip()
+                if payload.startswith(b"{"):
                     return consume_chunk_payload(payload)
 
                 return False
 
-            pending_event_lines: list[str] = []
+            # Stay on bytes per line; only assembled event payloads get decoded
+            # (json_loads accepts bytes directly).
+            pending_event_lines: list[bytes] = []
             for raw_line in response:
-                line = raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
+                line = raw_line.rstrip(b"\r\n")
 
                 if not line:
                     if consume_event_lines(pending_event_lines):
@@ -838,7 +1091,7 @@ def run_dedalus_stream(
                     pending_event_lines = []
                     continue
 
-                if line.startswith(":"):
+                if line.startswith(b":"):
                     continue
 
                 pending_event_lines.append(line)
@@ -846,38 +1099,53 @@ def run_dedalus_stream(
             if pending_event_lines:
                 consume_event_lines(pending_event_lines)
 
-            return "".join(full_text_parts), finish_reason, usage_counts
+            # Breaking at [DONE] leaves the chunked-encoding terminator (and
+            # any trailing SSE bytes) unread; drain to EOF so the keep-alive
+            # socket is clean before the next pooled request reuses it.
+            response.read()
+
+            flush_tokens()
+            return full_text.getvalue(), finish_reason, usage_counts
+
+    except (http.client.HTTPException, OSError) as error:
+        _discard_pooled_connection(url)
+        raise RuntimeError(f"Failed to reach Dedalus API: {error}") from error
+    except BaseException:
+        # Any other early exit (HTTP error body, stream error event, etc.)
+        # leaves the response partially read; never pool that socket.
+        _discard_pooled_connection(url)
+        raise
 
-    except urllib.error.HTTPError as error:
-        body = error.read().decode("utf-8", errors="replace")
-        default_message = f"Dedalus request failed with status {error.code}."
-        message = extract_error_message_from_json(body, default_message)
-        if message == default_message and body.strip():
-            message = f"{default_message} {body[:500]}"
-        raise RuntimeError(message) from error
-    except urllib.error.URLError as error:
-        raise RuntimeError(f"Failed to reach Dedalus API: {error.reason}") from error
 
+async def run_dedalus_stream_async(**kwargs: object) -> tuple[str, str, dict[str, int] | None]:
+    """Event-loop-safe variant of run_dedalus_stream for async callers.
 
-def build_sdk_input(messages: list[dict]) -> str:
-    lines: list[str] = []
-    for entry in messages:
-        role = entry.get("role")
-        content = entry.get("content")
-        if isinstance(role, str) and isinstance(content, str) and content.strip():
-            lines.append(f"{role.upper()}: {content}")
+    The blocking socket work runs in a worker thread so an orchestrating
+    event loop keeps servicing other tasks while tokens stream.
+    """
+    return await asyncio.to_thread(run_dedalus_stream, **kwargs)
 
-    if not lines:
-        return ""
 
-    lines.append("ASSISTANT:")
-    return "\n".join(lines)
+def build_sdk_input(messages: list[dict]) -> str:
+    # Single pass: join consumes the generator directly, no intermediate list.
+    body = "\n".join(
+        f"{entry['role'].upper()}: {entry['content']}"
+        for entry in messages
+        if isinstance(entry.get("role"), str)
+        and isinstance(entry.get("content"), str)
+        and entry["content"].strip()
+    )
+    if not body:
+        return ""
+    return body + "\nASSISTANT:"
 
 
 def run_dedalus_with_sdk(*, api_key: str, model: str, messages: list[dict]) -> tuple[str, str]:
     if not HAS_DEDALUS_SDK:
         raise RuntimeError("dedalus_labs SDK is not installed.")
 
+    from dedalus_labs import AsyncDedalus, DedalusRunner
+
     async def _run() -> str:
         client = AsyncDedalus(api_key=api_key)
         runner = DedalusRunner(client)
@@ -911,8 +1179,7 @@ def update_global_info_json(
     active_file_details["activeJsonFilePath"] = str(conversation_json_path)
     payload["convoName"] = normalize_conversation_title(conversation_name, conversation_id)
 
-    match = re.match(r"^conversation(\d+)$", conversation_id, flags=re.IGNORECASE)
-    conversation_index = int(match.group(1)) if match else None
+    conversation_index = _conversation_index(conversation_id)
     if conversation_index is not None:
         active_file_details["activeChatIndex"] = conversation_index
 
@@ -986,16 +1253,20 @@ def parse_available_models(raw: str) -> list[str]:
     if not isinstance(raw, str) or not raw.strip():
         return []
     deduped: list[str] = []
+    seen: set[str] = set()
     for part in raw.split(","):
         candidate = part.strip()
-        if not candidate:
-            continue
-        if candidate not in deduped:
+        if candidate and candidate not in seen:
+            seen.add(candidate)
             deduped.append(candidate)
     return deduped
 
 
 def main() -> int:
+    if uvloop is not None:
+        # libuv-backed event loop: lower per-callback overhead for the SDK
+        # path and any async streaming. No-op where uvloop is unavailable.
+        uvloop.install()
     load_dotenv()
     args = parse_args()
 
@@ -1093,6 +1364,16 @@ def main() -> int:
         emit("error", message="Dedalus returned an empty assistant response.")
         return 1
 
+    try:
+        append_transcript_turn(
+            conversation_transcript_path(conversation_json_path),
+            user_message,
+            assistant_text,
+        )
+    except Exception:
+        # Transcript logging is best-effort; the turn still streams normally.
+        pass
+
     if isinstance(usage, dict):
         prompt_tokens = to_non_negative_int(usage.get("prompt_tokens")) or 0
         completion_tokens = to_non_negative_int(usage.get("completion_tokens")) or 0
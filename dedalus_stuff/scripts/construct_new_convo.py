@@ -1,20 +1,65 @@
+import atexit
 import os
+import time
 from pathlib import Path
 import json
 
-def updateConvoCounter():
-  global_file_path = Path(__file__).resolve().parent.parent / "globalInfo.json"
+try:
+  import orjson
+except ImportError:  # pragma: no cover - optional local dependency
+  orjson = None
 
-  with open(global_file_path, "r", encoding="utf-8") as f:
-      global_data = json.load(f)
+_GLOBAL_FILE_PATH = Path(__file__).resolve().parent.parent / "globalInfo.json"
+
+# globalInfo.json stays in memory between calls; dirty state is flushed at
+# most every few seconds (and at exit) instead of on every counter bump.
+_FLUSH_INTERVAL_SECONDS = 5.0
+_global_cache = {"data": None, "dirty": False, "last_flush": 0.0}
+
+
+def _dumpJsonBytes(data):
+  if orjson is not None:
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+  return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _load_global_data():
+  if _global_cache["data"] is None:
+    with open(_GLOBAL_FILE_PATH, "rb") as f:
+      raw = f.read()
+    _global_cache["data"] = orjson.loads(raw) if orjson is not None else json.loads(raw)
+  return _global_cache["data"]
+
+
+def _flush_now():
+  if not _global_cache["dirty"] or _global_cache["data"] is None:
+    return
+  tmp_path = str(_GLOBAL_FILE_PATH) + ".tmp"
+  with open(tmp_path, "wb") as f:
+    f.write(_dumpJsonBytes(_global_cache["data"]))
+  os.replace(tmp_path, _GLOBAL_FILE_PATH)
+  _global_cache["dirty"] = False
+  _global_cache["last_flush"] = time.monotonic()
 
-  global_data["convoIndex"] = int(global_data["convoIndex"]) + 1
 
-  with open(global_file_path, "w", encoding="utf-8", newline="\n") as f:
-      json.dump(global_data, f, ensure_ascii=False, indent=2)
+def _flush_if_due():
+  if _global_cache["dirty"] and time.monotonic() - _global_cache["last_flush"] >= _FLUSH_INTERVAL_SECONDS:
+    _flush_now()
+
+
+atexit.register(_flush_now)
+
+
+def updateConvoCounter():
+  global_data = _load_global_data()
+
+  global_data["convoIndex"] = int(global_data["convoIndex"]) + 1
+  _global_cache["dirty"] = True
+  _flush_if_due()
 
   return global_data["convoIndex"]
 
+
 def createJsonFile(convoNum, model):
     updateConvoCounter()
     data = {
@@ -40,7 +85,11 @@ def createJsonFile(convoNum, model):
 
     file_path = "conversation" + str(convoNum) + ".json"
     out_path = Path() / "conversations" / file_path
-    out_path.parent.mkdir(parents=True, exist_ok=True) 
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(out_path, "wb") as f:
+        f.write(_dumpJsonBytes(data))
 
-    with open(out_path, "w", encoding="utf-8", newline="\n") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Sidecar transcript: per-turn messages append here as JSONL so writes
+    # stay O(1) per turn instead of rewriting the whole bundle.
+    out_path.with_suffix(".jsonl").touch(exist_ok=True)
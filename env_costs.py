@@ -17,5 +17,10 @@ cost_per_token = {
     "google/gemini-2.0-flash":          {"input": 0.60e-06, "output": 4.50e-06},
     "openai/gpt-4-32k":                 {"input": 3.00e-06, "output": 12.00e-06}
 }
+# Rates with the .14 carbon factor folded in, flattened to a tuple per model
+# so get_cost is one dict lookup and two multiply-adds.
+_COST = {m: (.14 * v["input"], .14 * v["output"]) for m, v in cost_per_token.items()}
+
 def get_cost(model, input_token, output_token):
-   return .14*(cost_per_token[model]["input"]*input_token +  cost_per_token[model]["output"]*output_token)
\ No newline at end of file
+   in_rate, out_rate = _COST[model]
+   return in_rate * input_token + out_rate * output_token
\ No newline at end of file
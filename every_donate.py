@@ -1,18 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-import json 
-
-charities = {"earthday.org": "133798288", 
-<<<<<<< HEAD
-             "GivePact":"920504087",
-             "Environmental Defense Fund":"116107128"}
-=======
-    "Malala Fund": "811397590",
-    "Democracy Now!": "010708733",
-    "The Marcy Lab School": "833754699",
-    "Upbring, Inc.": "741109745",
-    "Public Housing Community Fund": "474915755",
-    }
->>>>>>> add_library
+from requests.adapters import HTTPAdapter
+
+charities = {"earthday.org": "133798288",
+             "GivePact": "920504087",
+             "Environmental Defense Fund": "116107128",
+             "Malala Fund": "811397590",
+             "Democracy Now!": "010708733",
+             "The Marcy Lab School": "833754699",
+             "Upbring, Inc.": "741109745",
+             "Public Housing Community Fund": "474915755",
+             }
+
+# One session for the whole process: keep-alive pooling means repeat donations
+# reuse the same TLS connection instead of re-handshaking per call.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
 def get_donate_address(nonprofit_ein, name, email):
     payload = {
@@ -22,16 +26,10 @@ def get_donate_address(nonprofit_ein, name, email):
         "share_data": True,
         "donor_name": name,
         "donor_email": email
-    } 
+    }
 
     link = "https://api.givepact.io/v1/donate"
-    header ={"Content-Type": "application/json"}
-    response = requests.post(link, headers=header, data=json.dumps(payload))
-<<<<<<< HEAD
-
-    if(response.status_code != 200): print(response.status_code)
-=======
->>>>>>> add_library
+    response = _SESSION.post(link, json=payload, timeout=10)
 
     if(response.status_code != 200):
         print(response.status_code)
@@ -47,9 +45,15 @@ def get_donate_address(nonprofit_ein, name, email):
     debug_response_json = debug_response.json()
     print(debug_response_json)"""
 
-    return deposit_addr 
-<<<<<<< HEAD
+    return deposit_addr
+
+def donate_all(name, email):
+    # Fan the per-charity round-trips out over worker threads so N requests
+    # cost roughly one RTT instead of N; the pooled session above is
+    # thread-safe and caps us at 4 live connections. Results come back in
+    # charities order, None for any request that failed.
+    with ThreadPoolExecutor(max_workers=min(4, len(charities))) as pool:
+        return list(pool.map(lambda ein: get_donate_address(ein, name, email), charities))
 
-print(get_donate_address("earthday.org", "B", "E@e.org"))
-=======
->>>>>>> add_library
+if __name__ == "__main__":
+    print(get_donate_address("earthday.org", "B", "E@e.org"))
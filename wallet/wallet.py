@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import base64
+import functools
 import getpass
 import hashlib
 import json
@@ -12,61 +13,114 @@ from typing import Any, Dict, Optional
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 
 try:
-    import xrpl
-    from xrpl.clients import JsonRpcClient
-    from xrpl.models.requests.account_info import AccountInfo
-    from xrpl.models.requests.account_tx import AccountTx
-    from xrpl.models.transactions import CheckCreate
-    from xrpl.transaction import XRPLReliableSubmissionException, submit_and_wait
-    from xrpl.wallet import Wallet, generate_faucet_wallet
-except ImportError as exc:  # pragma: no cover - clear error message for missing dep
-    raise SystemExit(
-        "Missing dependency: xrpl-py. Install with `python3 -m pip install xrpl-py` "
-        "or add it to your environment before using wallet.py."
-    ) from exc
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
 
 try:
-    from cryptography.fernet import Fernet, InvalidToken
-    from cryptography.hazmat.backends import default_backend
-    from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-except ImportError as exc:  # pragma: no cover - clear error message for missing dep
-    raise SystemExit(
-        "Missing dependency: cryptography. Install with `python3 -m pip install cryptography` "
-        "or add it to your environment before using wallet.py."
-    ) from exc
+    import orjson
+except ImportError:  # pragma: no cover - optional local dependency
+    orjson = None
 
 JSON_RPC_URL = "https://s.altnet.rippletest.net:51234/"
 DEFAULT_WALLET_FILE = Path(__file__).resolve().parent / "wallets" / "wallet.json"
 EVERY_DONATE_ADDRESS = "rLjd5uRaxpi84pcn9ikbiMWPGqYfLrh15w"
 
-client = JsonRpcClient(JSON_RPC_URL)
+
+def _require_dependency(module: str, package: str) -> None:
+    # xrpl-py and cryptography are imported lazily inside the functions that
+    # need them so `--help` and pure-file commands skip their import cost;
+    # this guard keeps the clear install message for missing deps.
+    try:
+        __import__(module)
+    except ImportError as exc:  # pragma: no cover - clear error message for missing dep
+        raise SystemExit(
+            f"Missing dependency: {package}. Install with `python3 -m pip install {package}` "
+            "or add it to your environment before using wallet.py."
+        ) from exc
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client():
+    # One client for the whole process: chained commands (e.g. info --refresh
+    # then txs) reuse its underlying HTTP session instead of re-handshaking
+    # TLS per request. Still lazy, so --help never constructs it.
+    _require_dependency("xrpl", "xrpl-py")
+    from xrpl.clients import JsonRpcClient
+
+    return JsonRpcClient(JSON_RPC_URL)
+
+# path -> (mtime_ns, size, parsed payload); skips re-reading and re-parsing
+# the wallet file when chained commands hit it in one process.
+_WALLET_CACHE: Dict[str, tuple] = {}
+
+
+def _json_dumps_bytes(payload: Dict[str, Any]) -> bytes:
+    # Insertion order is fine for the file's consumers; sorting every key on
+    # each write was pure CPU (integrity only covers seed_ct, via its hmac).
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def _json_loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def _write_json(path: Path, payload: Dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
-    try:
-        # Best-effort: tighten permissions on POSIX; harmless on Windows
-        os.chmod(path, 0o600)
-    except Exception:
-        pass
-
-
-def _derive_key(passphrase: str, salt: bytes) -> bytes:
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=150_000,
-        backend=default_backend(),
-    )
-    return base64.urlsafe_b64encode(kdf.derive(passphrase.encode()))
+    lock_path = path.with_suffix(path.suffix + ".lock")
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+
+    # Exclusive lock against concurrent CLI invocations, then write the whole
+    # payload to a temp file and atomically rename it into place so a crash
+    # mid-write can never corrupt the wallet file.
+    with open(lock_path, "w") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            data = _json_dumps_bytes(payload)
+            with open(temp_path, "wb") as handle:
+                # One pre-encoded buffer, one write, then fsync so the bytes
+                # are durable before the rename publishes them.
+                handle.write(data)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temp_path, path)
+            try:
+                # Best-effort: tighten permissions on POSIX; harmless on Windows
+                os.chmod(path, 0o600)
+            except Exception:
+                pass
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+@functools.lru_cache(maxsize=8)
+def _derive_key(passphrase: str, salt: bytes, kdf: str = "scrypt") -> bytes:
+    # New wallets use memory-hard scrypt (OpenSSL's C path), which is much
+    # cheaper per unlock than 150k PBKDF2 rounds at comparable resistance.
+    # The pbkdf2 branch keeps wallets written before the kdf field decryptable.
+    # Either way the lru_cache means chained commands in one run (e.g. info
+    # then send) pay the derivation once.
+    if kdf == "scrypt":
+        derived = hashlib.scrypt(passphrase.encode(), salt=salt, n=2**14, r=8, p=1, dklen=32)
+    elif kdf == "pbkdf2":
+        derived = hashlib.pbkdf2_hmac("sha256", passphrase.encode(), salt, 150_000, dklen=32)
+    else:
+        raise ValueError(f"Unsupported wallet kdf: {kdf}")
+    return base64.urlsafe_b64encode(derived)
 
 
 def _encrypt_seed(seed: str, passphrase: str) -> Dict[str, Any]:
+    _require_dependency("cryptography", "cryptography")
+    from cryptography.fernet import Fernet
+
     salt = os.urandom(16)
-    key = _derive_key(passphrase, salt)
+    key = _derive_key(passphrase, salt, "scrypt")
     fernet = Fernet(key)
     seed_ct = fernet.encrypt(seed.encode())
     hmac = hashlib.sha256(seed_ct).hexdigest()
@@ -74,15 +128,20 @@ def _encrypt_seed(seed: str, passphrase: str) -> Dict[str, Any]:
         "seed_ct": seed_ct.decode(),
         "salt": base64.b64encode(salt).decode(),
         "hmac": hmac,
+        "kdf": "scrypt",
         "encrypted": True,
     }
 
 
 def _decrypt_seed(raw: Dict[str, Any], passphrase: str) -> str:
+    _require_dependency("cryptography", "cryptography")
+    from cryptography.fernet import Fernet, InvalidToken
+
     if "seed_ct" not in raw or "salt" not in raw:
         raise ValueError("Wallet file is not encrypted or missing fields.")
     salt = base64.b64decode(raw["salt"])
-    key = _derive_key(passphrase, salt)
+    # Wallets written before kdf versioning were always PBKDF2.
+    key = _derive_key(passphrase, salt, raw.get("kdf", "pbkdf2"))
     fernet = Fernet(key)
     seed_ct = raw["seed_ct"].encode()
     expected_hmac = raw.get("hmac")
@@ -94,15 +153,24 @@ def _decrypt_seed(raw: Dict[str, Any], passphrase: str) -> str:
         raise ValueError("Incorrect passphrase for encrypted wallet file.") from exc
 
 
+# Remembers an interactively entered passphrase so chained calls in one
+# process prompt at most once.
+_prompted_passphrase: Optional[str] = None
+
+
 def _require_passphrase(explicit: Optional[str] = None) -> str:
+    global _prompted_passphrase
     if explicit:
         return explicit
     env = os.environ.get("WALLET_PASSPHRASE")
     if env:
         return env
+    if _prompted_passphrase:
+        return _prompted_passphrase
     # For CLI use only; API callers should set WALLET_PASSPHRASE
     try:
-        return getpass.getpass("Wallet passphrase: ")
+        _prompted_passphrase = getpass.getpass("Wallet passphrase: ")
+        return _prompted_passphrase
     except (EOFError, getpass.GetPassWarning):
         raise ValueError(
             "Passphrase is required. Set WALLET_PASSPHRASE env var or pass --passphrase when running wallet.py."
@@ -111,6 +179,11 @@ def _require_passphrase(explicit: Optional[str] = None) -> str:
 
 def create_wallet(wallet_file: Path = DEFAULT_WALLET_FILE, passphrase: Optional[str] = None) -> Dict[str, Any]:
     passphrase = _require_passphrase(passphrase)
+    _require_dependency("xrpl", "xrpl-py")
+    from xrpl.models.requests.account_info import AccountInfo
+    from xrpl.wallet import generate_faucet_wallet
+
+    client = _get_client()
     wallet = generate_faucet_wallet(client, debug=False)
     account_info = AccountInfo(
         account=wallet.classic_address,
@@ -141,6 +214,10 @@ def import_wallet(
     passphrase: Optional[str] = None,
 ) -> Dict[str, Any]:
     passphrase = _require_passphrase(passphrase)
+    _require_dependency("xrpl", "xrpl-py")
+    from xrpl.models.requests.account_info import AccountInfo
+    from xrpl.wallet import Wallet
+
     wallet = Wallet.from_seed(seed)
 
     account_data: Dict[str, Any] | None = None
@@ -148,7 +225,7 @@ def import_wallet(
 
     if refresh:
         try:
-            response = client.request(
+            response = _get_client().request(
                 AccountInfo(account=wallet.classic_address, ledger_index="validated", strict=True)
             )
             account_data = response.result.get("account_data")
@@ -182,7 +259,15 @@ def load_wallet(wallet_file: Path = DEFAULT_WALLET_FILE, passphrase: Optional[st
             f"Wallet file not found. Expected one at {wallet_file}. Run `create` first."
         )
 
-    raw = json.loads(wallet_file.read_text(encoding="utf-8"))
+    stat = wallet_file.stat()
+    cache_key = str(wallet_file)
+    cached = _WALLET_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        raw = cached[2]
+    else:
+        # Bytes straight into the parser; skips the text decode pass.
+        raw = _json_loads(wallet_file.read_bytes())
+        _WALLET_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, raw)
     account_data = raw.get("account_data", {})
     encrypted = "seed_ct" in raw
     seed: Optional[str] = None
@@ -214,6 +299,10 @@ def list_transactions(wallet_file: Path, limit: int = 10, passphrase: Optional[s
     if not address:
         raise ValueError("Wallet address unavailable; create or import first.")
 
+    _require_dependency("xrpl", "xrpl-py")
+    from xrpl.models.requests.account_tx import AccountTx
+
+    client = _get_client()
     req = AccountTx(
         account=address,
         ledger_index_min=-1,
@@ -239,6 +328,10 @@ def list_transactions(wallet_file: Path, limit: int = 10, passphrase: Optional[s
 
 
 def refresh_account_info(address: str) -> Dict[str, Any]:
+    _require_dependency("xrpl", "xrpl-py")
+    from xrpl.models.requests.account_info import AccountInfo
+
+    client = _get_client()
     account_info = AccountInfo(
         account=address,
         ledger_index="validated",
@@ -248,18 +341,29 @@ def refresh_account_info(address: str) -> Dict[str, Any]:
     return response.result
 
 
+_DROPS_PER_XRP = Decimal(1_000_000)
+
+
 def _to_drops(amount: str) -> str:
     """
     Convert an XRP amount expressed in XRP (can include decimals) into drops as a string.
     XRPL transactions require drops to be an integer string.
     """
+    # Whole-XRP amounts (the common CLI case) skip Decimal entirely.
+    # isdecimal, not isdigit: superscripts etc. fall through to the Decimal
+    # branch and its friendly error instead of blowing up int().
+    if isinstance(amount, str) and amount.isdecimal():
+        drops = int(amount) * 1_000_000
+        if drops <= 0:
+            raise ValueError("Amount must be greater than zero.")
+        return str(drops)
     try:
         dec_amount = Decimal(amount)
     except (InvalidOperation, TypeError):
         raise ValueError("Amount must be a numeric value in XRP.")
     if dec_amount <= 0:
         raise ValueError("Amount must be greater than zero.")
-    drops = (dec_amount * Decimal(1_000_000)).quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+    drops = (dec_amount * _DROPS_PER_XRP).quantize(Decimal("1"), rounding=ROUND_HALF_UP)
     return str(int(drops))
 
 
@@ -269,6 +373,11 @@ def send_check(wallet_file: Path, amount: str, destination: str, passphrase: Opt
     if not seed:
         raise ValueError("Wallet seed missing from wallet file. Decryption failed or file is empty.")
 
+    _require_dependency("xrpl", "xrpl-py")
+    from xrpl.models.transactions import CheckCreate
+    from xrpl.transaction import XRPLReliableSubmissionException, submit_and_wait
+    from xrpl.wallet import Wallet
+
     wallet = Wallet.from_seed(seed)
     send_max_drops = _to_drops(amount)
     check_tx = CheckCreate(
@@ -278,7 +387,7 @@ def send_check(wallet_file: Path, amount: str, destination: str, passphrase: Opt
     )
 
     try:
-        response = submit_and_wait(check_tx, client, wallet)
+        response = submit_and_wait(check_tx, _get_client(), wallet)
         result = response.result
     except XRPLReliableSubmissionException as exc:
         raise RuntimeError(f"Submit failed: {exc}") from exc
@@ -392,24 +501,30 @@ def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
+    # Resolve the passphrase once per run (flag or env); every call below
+    # receives the same value, so nothing re-checks the environment or
+    # re-prompts mid-command. Interactive prompting stays lazy for wallets
+    # that turn out not to need it.
+    passphrase = args.passphrase or os.environ.get("WALLET_PASSPHRASE")
+
     try:
         if args.command == "create":
             if args.wallet_file.exists() and not args.force:
-                data = load_wallet(args.wallet_file, passphrase=args.passphrase)
+                data = load_wallet(args.wallet_file, passphrase=passphrase)
             else:
-                data = create_wallet(args.wallet_file, passphrase=args.passphrase)
+                data = create_wallet(args.wallet_file, passphrase=passphrase)
         elif args.command == "info":
-            data = load_wallet(args.wallet_file, passphrase=args.passphrase)
+            data = load_wallet(args.wallet_file, passphrase=passphrase)
             if args.refresh and data.get("address"):
                 refreshed = refresh_account_info(data["address"])
                 data["account_data"] = refreshed.get("account_data")
                 data["validated_ledger"] = refreshed.get("validated_ledger")
         elif args.command == "send-check":
-            data = send_check(args.wallet_file, str(args.amount), args.destination, passphrase=args.passphrase)
+            data = send_check(args.wallet_file, str(args.amount), args.destination, passphrase=passphrase)
         elif args.command == "import":
-            data = import_wallet(args.seed, args.wallet_file, refresh=args.refresh, passphrase=args.passphrase)
+            data = import_wallet(args.seed, args.wallet_file, refresh=args.refresh, passphrase=passphrase)
         elif args.command == "txs":
-            data = list_transactions(args.wallet_file, limit=args.limit, passphrase=args.passphrase)
+            data = list_transactions(args.wallet_file, limit=args.limit, passphrase=passphrase)
         else:
             raise ValueError(f"Unsupported command: {args.command}")
 